@@ -1,7 +1,13 @@
 import json
-import random
+import numpy as np
 from typing import List, Dict
 from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
 
 # Constants for generating realistic data
 GENRES = [
@@ -55,58 +61,76 @@ ADJECTIVES = [
     "Deep",
 ]
 
+# Title and content description templates, filled in with str.format
+TITLE_FORMATS = (
+    "{adjective} {topic}",
+    "{topic} {genre}",
+    "{adjective} {genre} with {topic}",
+    "{topic}: A {adjective} Guide",
+    "Learning {topic}",
+    "{topic} in Practice",
+)
+
+CONTENT_TEMPLATES = (
+    "A comprehensive guide to {topic} focusing on {genre} applications.",
+    "Learn {topic} through practical examples in {genre}.",
+    "Master {topic} with this {adjective} guide to {genre}.",
+    "Everything you need to know about {topic} in {genre}.",
+    "From beginner to expert in {topic} with focus on {genre}.",
+)
+
 
 def generate_book_data(num_books: int = 1000) -> List[Dict]:
     """Generate fake book data"""
     books = []
     current_date = datetime.now()
-
-    for id in range(1, num_books + 1):
+    rng = np.random.default_rng()
+
+    # Draw every random field for all books up front, one vectorized call per field
+    topic_idx = rng.integers(0, len(TOPICS), size=num_books).tolist()
+    genre_idx = rng.integers(0, len(GENRES), size=num_books).tolist()
+    adjective_idx = rng.integers(0, len(ADJECTIVES), size=num_books).tolist()
+    title_idx = rng.integers(0, len(TITLE_FORMATS), size=num_books).tolist()
+    content_idx = rng.integers(0, len(CONTENT_TEMPLATES), size=num_books).tolist()
+    pub_days = rng.integers(0, 1826, size=num_books).tolist()
+    ratings_counts = rng.integers(0, 1001, size=num_books).tolist()
+    average_ratings = np.round(rng.uniform(3.0, 5.0, size=num_books), 1).tolist()
+    sales_ranks = rng.integers(1, 10001, size=num_books).tolist()
+    prices = np.round(rng.uniform(9.99, 99.99, size=num_books), 2).tolist()
+    in_stock = (rng.random(num_books) < 0.75).tolist()  # 75% chance of being in stock
+    # Extra topics: a random permutation per book, of which the first 0-3 are kept
+    extra_topic_counts = rng.integers(0, 4, size=num_books).tolist()
+    extra_topic_idx = np.argsort(rng.random((num_books, len(TOPICS))), axis=1)[:, :3].tolist()
+
+    for i in range(num_books):
         # Generate basic book info
-        topic = random.choice(TOPICS)
-        genre = random.choice(GENRES)
-        adjective = random.choice(ADJECTIVES)
-
-        # Create title variations
-        title_formats = [
-            f"{adjective} {topic}",
-            f"{topic} {genre}",
-            f"{adjective} {genre} with {topic}",
-            f"{topic}: A {adjective} Guide",
-            f"Learning {topic}",
-            f"{topic} in Practice",
-        ]
-
-        title = random.choice(title_formats)
+        topic = TOPICS[topic_idx[i]]
+        genre = GENRES[genre_idx[i]]
+        adjective = ADJECTIVES[adjective_idx[i]]
+
+        # Create title variation
+        title = TITLE_FORMATS[title_idx[i]].format(topic=topic, genre=genre, adjective=adjective)
 
         # Generate publication date
-        pub_date = (current_date - timedelta(days=random.randint(0, 1825))).strftime("%Y-%m-%d")
+        pub_date = (current_date - timedelta(days=pub_days[i])).strftime("%Y-%m-%d")
 
         # Generate content description
-        content_templates = [
-            f"A comprehensive guide to {topic} focusing on {genre} applications.",
-            f"Learn {topic} through practical examples in {genre}.",
-            f"Master {topic} with this {adjective.lower()} guide to {genre}.",
-            f"Everything you need to know about {topic} in {genre}.",
-            f"From beginner to expert in {topic} with focus on {genre}.",
-        ]
-
-        content = random.choice(content_templates)
+        content = CONTENT_TEMPLATES[content_idx[i]].format(topic=topic, genre=genre, adjective=adjective.lower())
 
         # Generate popularity metrics
-        popularity = {"ratings_count": random.randint(0, 1000), "average_rating": round(random.uniform(3.0, 5.0), 1), "sales_rank": random.randint(1, 10000)}
+        popularity = {"ratings_count": ratings_counts[i], "average_rating": average_ratings[i], "sales_rank": sales_ranks[i]}
 
         # Create book entry
         book = {
-            "id": id,
+            "id": i + 1,
             "title": title,
             "genre": genre,
-            "topics": [topic] + random.sample(TOPICS, k=random.randint(0, 3)),
+            "topics": [topic] + [TOPICS[t] for t in extra_topic_idx[i][: extra_topic_counts[i]]],
             "content": content,
             "publication_date": pub_date,
             "popularity": popularity,
-            "price": round(random.uniform(9.99, 99.99), 2),
-            "in_stock": random.choice([True, True, True, False]),  # 75% chance of being in stock
+            "price": prices[i],
+            "in_stock": in_stock[i],
         }
 
         books.append(book)
@@ -116,6 +140,10 @@ def generate_book_data(num_books: int = 1000) -> List[Dict]:
 
 def save_mock_data(books: List[Dict], filename: str = "mock_data.json") -> None:
     """Save generated data to JSON file"""
+    if orjson is not None:
+        Path(filename).write_bytes(orjson.dumps({"books": books}, option=orjson.OPT_INDENT_2))
+        return
+
     with open(filename, "w", encoding="utf-8") as f:
         json.dump({"books": books}, f, indent=2)
 
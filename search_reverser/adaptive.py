@@ -1,5 +1,6 @@
 from typing import Dict, List, Any
 from collections import defaultdict
+import functools
 import random
 
 
@@ -44,30 +45,45 @@ class AdaptiveQueryStrategy:
             "manufacturing": ["production", "assembly", "quality", "automation", "industrial", "process"],
         }
 
-        # Enhanced query patterns
+        # Enhanced query patterns: (template, choices) where {t} is the term and {x} one of the choices
         self.query_patterns = {
             # Basic patterns
-            "simple": lambda term: term,
-            "quoted": lambda term: f'"{term}"',
+            "simple": ("{t}", ()),
+            "quoted": ('"{t}"', ()),
             # Compound patterns
-            "and_combo": lambda term: f"{term} AND {random.choice(['guide', 'tutorial', 'introduction'])}",
-            "or_combo": lambda term: f"{term} OR {random.choice(['course', 'training', 'learning'])}",
+            "and_combo": ("{t} AND {x}", ("guide", "tutorial", "introduction")),
+            "or_combo": ("{t} OR {x}", ("course", "training", "learning")),
             # Specific patterns
-            "beginner": lambda term: f"beginner {term}",
-            "advanced": lambda term: f"advanced {term}",
-            "learn": lambda term: f"learn {term}",
+            "beginner": ("beginner {t}", ()),
+            "advanced": ("advanced {t}", ()),
+            "learn": ("learn {t}", ()),
             # Descriptive patterns
-            "with": lambda term: f"{term} with {random.choice(['examples', 'practice', 'exercises'])}",
-            "for": lambda term: f"{term} for {random.choice(['beginners', 'professionals', 'students'])}",
+            "with": ("{t} with {x}", ("examples", "practice", "exercises")),
+            "for": ("{t} for {x}", ("beginners", "professionals", "students")),
             # Topic-specific patterns
-            "course": lambda term: f"{term} course",
-            "tutorial": lambda term: f"{term} tutorial",
-            "guide": lambda term: f"complete {term} guide",
+            "course": ("{t} course", ()),
+            "tutorial": ("{t} tutorial", ()),
+            "guide": ("complete {t} guide", ()),
         }
 
         # Add domain weighting to track success rates by domain
         self.domain_weights = {domain: 1.0 for domain in self.domains.keys()}
 
+        # Key tuples for random draws, so generators don't rebuild lists from the dicts every round
+        self._domain_keys = tuple(self.domains.keys())
+        self._pattern_keys = tuple(self.query_patterns.keys())
+
+        # Term -> position of the first domain listing it, so domain lookup is one hash per query term
+        self._term_to_domain = {}
+        for rank, domain in enumerate(self._domain_keys):
+            for term in self.domains[domain]:
+                self._term_to_domain.setdefault(term.lower(), rank)
+
+        # Query classification only depends on the query string, so memoize it per instance
+        self._identify_domain = functools.lru_cache(maxsize=4096)(self._identify_domain)
+        self._identify_query_pattern = functools.lru_cache(maxsize=4096)(self._identify_query_pattern)
+        self._categorize_query = functools.lru_cache(maxsize=4096)(self._categorize_query)
+
     def analyze_response(self, query: str, results: List[Dict]) -> None:
         """Analyze search results and update learning patterns"""
         success = bool(results)
@@ -82,9 +98,9 @@ class AdaptiveQueryStrategy:
 
             # Extract successful terms and patterns
             successful_terms = set()
+            query_terms = set(query.lower().split())
             for result in results:
                 title_terms = set(result["title"].lower().split())
-                query_terms = set(query.lower().split())
                 matching_terms = title_terms & query_terms
                 successful_terms.update(matching_terms)
 
@@ -145,7 +161,7 @@ class AdaptiveQueryStrategy:
 
         # If we haven't selected enough domains, add some randomly
         while len(selected_domains) < 3:
-            domain = random.choice(list(self.domains.keys()))
+            domain = random.choice(self._domain_keys)
             if domain not in selected_domains:
                 selected_domains.append(domain)
 
@@ -160,40 +176,42 @@ class AdaptiveQueryStrategy:
     def _generate_pattern_exploration_queries(self) -> List[Dict]:
         """Generate queries with different patterns in successful domains"""
         queries = []
-        successful_domains = self.learned_patterns["successful_domains"] or set(self.domains.keys())
+        successful_domains = tuple(self.learned_patterns["successful_domains"]) or self._domain_keys
+        domains = random.sample(successful_domains, min(2, len(successful_domains)))
 
-        for domain in random.sample(list(successful_domains), min(2, len(successful_domains))):
+        for domain, pattern_type in zip(domains, random.choices(self._pattern_keys, k=len(domains))):
             terms = self.domains[domain]
             term = random.choice(terms)
-            pattern_type = random.choice(list(self.query_patterns.keys()))
-            pattern_func = self.query_patterns[pattern_type]
 
-            queries.append({"query": pattern_func(term), "type": pattern_type, "description": f"Testing {pattern_type} pattern in {domain}", "domain": domain})
+            queries.append({"query": self._apply_pattern(pattern_type, term), "type": pattern_type, "description": f"Testing {pattern_type} pattern in {domain}", "domain": domain})
         return queries
 
     def _generate_optimized_queries(self) -> List[Dict]:
         """Generate optimized queries based on learned patterns"""
         queries = []
-        successful_patterns = self.learned_patterns["successful_patterns"] or list(self.query_patterns.keys())
-        successful_domains = self.learned_patterns["successful_domains"] or set(self.domains.keys())
+        successful_patterns = self.learned_patterns["successful_patterns"] or self._pattern_keys
+        successful_domains = tuple(self.learned_patterns["successful_domains"]) or self._domain_keys
+        domains = random.sample(successful_domains, min(2, len(successful_domains)))
 
-        for domain in random.sample(list(successful_domains), min(2, len(successful_domains))):
-            pattern_type = random.choice(successful_patterns)
+        for domain, pattern_type in zip(domains, random.choices(successful_patterns, k=len(domains))):
             terms = self.domains[domain]
             term = random.choice(terms)
-            pattern_func = self.query_patterns[pattern_type]
 
-            queries.append({"query": pattern_func(term), "type": "optimized", "description": f"Optimized {pattern_type} query for {domain}", "domain": domain})
+            queries.append({"query": self._apply_pattern(pattern_type, term), "type": "optimized", "description": f"Optimized {pattern_type} query for {domain}", "domain": domain})
 
         return queries
 
+    def _apply_pattern(self, pattern_type: str, term: str) -> str:
+        """Build a query for `term` from a pattern template"""
+        template, choices = self.query_patterns[pattern_type]
+        if choices:
+            return template.format(t=term, x=random.choice(choices))
+        return template.format(t=term)
+
     def _identify_domain(self, query: str) -> str:
         """Identify which domain a query belongs to"""
-        query_terms = set(query.lower().split())
-        for domain, terms in self.domains.items():
-            if query_terms & set(term.lower() for term in terms):
-                return domain
-        return "general"
+        ranks = [self._term_to_domain[term] for term in query.lower().split() if term in self._term_to_domain]
+        return self._domain_keys[min(ranks)] if ranks else "general"
 
     def _identify_query_pattern(self, query: str) -> str:
         """Identify the pattern used in a query"""
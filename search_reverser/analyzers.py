@@ -67,11 +67,13 @@ class ResultAnalyzer:
 
         total_queries = len(results)
         fuzzy_matches = sum(1 for r in results.values() if r["characteristics"]["matching_type"] == "fuzzy")
+        # Prefer timings measured without other requests in flight, they reflect the server's service time
+        timings = [r["timing"] for r in results.values() if not r.get("concurrent")] or [r["timing"] for r in results.values()]
 
         return {
             "fuzzy_match_ratio": fuzzy_matches / total_queries if total_queries > 0 else 0.0,
             "exact_match_ratio": (total_queries - fuzzy_matches) / total_queries if total_queries > 0 else 0.0,
-            "average_response_time": sum(r["timing"] for r in results.values()) / total_queries if total_queries > 0 else 0.0,
+            "average_response_time": sum(timings) / len(timings) if timings else 0.0,
         }
 
     def calculate_confidence(self, results: Dict) -> float:
@@ -1,11 +1,34 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from time import sleep
+from requests.adapters import HTTPAdapter
+import time
+from .utils import TokenBucket
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib decoder used by requests
+    orjson = None
 
 
 class DataCollector:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, max_workers: int = 8, max_rate: float = 5, time_period: float = 1.0, session: Optional[requests.Session] = None):
+        self.max_workers = max_workers
+        # Requests from all workers share one rate limit budget
+        self._limiter = TokenBucket(max_rate, time_period)
+        # Worker threads are created once and reused by every batch
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Reuse the caller's session and its connection pool if given
+        self.session = session if session is not None else self._make_session(max_workers)
+
+    @staticmethod
+    def _make_session(max_workers: int) -> requests.Session:
+        """Create a session with a keep-alive connection pool large enough for every concurrent worker"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def generate_test_cases(self) -> List[Dict]:
         """Generate a comprehensive set of test cases"""
@@ -20,11 +43,29 @@ class DataCollector:
 
     def perform_search(self, target_url: str, query: str) -> List[Dict]:
         """Perform a search request and return results"""
+        return self.perform_timed_search(target_url, query)[0]
+
+    def perform_timed_search(self, target_url: str, query: str) -> Tuple[List[Dict], int]:
+        """Perform a search request and return results with the request time in nanoseconds"""
+        self._limiter.acquire()  # Respect rate limits
+        start = time.perf_counter_ns()
         try:
             response = self.session.get(target_url, params={"q": query}, headers={"User-Agent": "SearchReverseEngineer/1.0", "Accept": "application/json"})
             response.raise_for_status()
-            sleep(1)  # Respect rate limits
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            results = orjson.loads(response.content) if orjson is not None else response.json()
+            return results, time.perf_counter_ns() - start
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error performing search: {e}")
+            return [], time.perf_counter_ns() - start
+
+    def perform_searches(self, target_url: str, queries: List[str]) -> List[Tuple[List[Dict], int, bool]]:
+        """Perform independent timed searches and return (results, elapsed_ns, concurrent) in query order.
+
+        The first query runs alone so its timing is the server's uncontended service time; the rest run
+        concurrently and their timings include queueing behind the other in-flight requests.
+        """
+        if not queries:
             return []
+        first = self.perform_timed_search(target_url, queries[0])
+        rest = self._executor.map(lambda query: self.perform_timed_search(target_url, query), queries[1:])
+        return [(*first, False)] + [(results, elapsed_ns, True) for results, elapsed_ns in rest]
@@ -1,25 +1,30 @@
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+import requests
 from .analyzers import ResultAnalyzer
 from .collectors import DataCollector
-from .utils import measure_timing
 from .adaptive import AdaptiveQueryStrategy
 
 
 class SearchReverseEngineer:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.results_database = {}
         self.analyzer = ResultAnalyzer()
-        self.collector = DataCollector()
+        self.collector = DataCollector(session=session)
         self.adaptive_strategy = AdaptiveQueryStrategy()
 
-    def collect_sample(self, query: str, results: List[Any]) -> Dict:
-        """Store and analyze a search query and its results"""
+    def collect_sample(self, query: str, results: List[Any], elapsed_ns: int, concurrent: bool = False) -> Dict:
+        """Store and analyze a search query, its results and the time the search took.
+
+        `concurrent` marks timings measured while other requests were in flight, which are latency under load
+        rather than the server's service time.
+        """
         analysis = {
             "results": results,
             "timestamp": time.time(),
             "characteristics": self.analyzer.analyze_results(results),
-            "timing": measure_timing(lambda: results),  # Measure response time
+            "timing": elapsed_ns / 1e9,  # Response time in seconds
+            "concurrent": concurrent,
         }
         self.results_database[query] = analysis
         return analysis
@@ -28,13 +33,13 @@ class SearchReverseEngineer:
         """Run an adaptive test suite against a search endpoint"""
         results = {}
 
-        # Initial exploration phase
+        # Initial exploration phase; the initial queries are fixed, so they can all be fetched concurrently
         test_cases = self.adaptive_strategy.generate_next_queries({})
+        initial_results = self.collector.perform_searches(target_url, [test["query"] for test in test_cases])
 
-        for test in test_cases:
+        for test, (search_results, elapsed_ns, concurrent) in zip(test_cases, initial_results):
             query = test["query"]
-            search_results = self.collector.perform_search(target_url, query)
-            results[query] = self.collect_sample(query, search_results)
+            results[query] = self.collect_sample(query, search_results, elapsed_ns, concurrent)
 
             # Update adaptive strategy with results
             self.adaptive_strategy.analyze_response(query, search_results)
@@ -42,10 +47,9 @@ class SearchReverseEngineer:
             # Generate next batch of queries based on learning
             next_queries = self.adaptive_strategy.generate_next_queries(results)
             if next_queries:
-                for test in next_queries:
-                    query = test["query"]
-                    search_results = self.collector.perform_search(target_url, query)
-                    results[query] = self.collect_sample(query, search_results)
+                batch = [next_test["query"] for next_test in next_queries]
+                for query, (search_results, elapsed_ns, concurrent) in zip(batch, self.collector.perform_searches(target_url, batch)):
+                    results[query] = self.collect_sample(query, search_results, elapsed_ns, concurrent)
                     self.adaptive_strategy.analyze_response(query, search_results)
 
         return {**self.generate_hypothesis(results), "learning_status": self.adaptive_strategy.get_learning_status()}
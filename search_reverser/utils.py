@@ -1,9 +1,38 @@
+import threading
 import time
 from typing import Callable, Any
 
 
 def measure_timing(func: Callable) -> float:
-    """Measure the execution time of a function"""
-    start_time = time.time()
+    """Measure the execution time of a function in seconds"""
+    start_time = time.perf_counter_ns()
     func()
-    return time.time() - start_time
+    return (time.perf_counter_ns() - start_time) / 1e9
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter allowing `max_rate` acquisitions per `time_period` seconds"""
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        # Burst size; at least one token so rates below one per period can still acquire
+        self.capacity = max(1.0, float(max_rate))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.max_rate / self.time_period)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.time_period / self.max_rate
+            time.sleep(wait)
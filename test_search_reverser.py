@@ -1,18 +1,58 @@
+import functools
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
-from search_reverser import SearchReverseEngineer
-import requests
+from typing import TYPE_CHECKING, List, Dict
+
+if TYPE_CHECKING:
+    import requests
+    from search_reverser import SearchReverseEngineer
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session() -> "requests.Session":
+    """Shared keep-alive session for the connection probe and the reverser's searches, created on first use"""
+    global _SESSION
+    # Probes may run on several threads; the lock makes sure only one session is ever built
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            _SESSION = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+            _SESSION.mount("http://", adapter)
+            _SESSION.mount("https://", adapter)
+        return _SESSION
+
+
+# Behaviors reported by analyze_search_behavior and their report labels
+_BEHAVIOR_KEYS = ("case_sensitive", "uses_fuzzy_matching", "removes_stop_words", "considers_word_order", "boosts_by_popularity", "considers_recency")
+_BEHAVIOR_LABELS = {behavior: behavior.replace("_", " ").title() for behavior in _BEHAVIOR_KEYS}
+
+
+@functools.lru_cache(maxsize=64)
+def _base_url(url: str) -> str:
+    """Return the server root for a search endpoint URL"""
+    return url.rsplit("/search", 1)[0]
+
+
 def test_server_connection(url: str) -> bool:
     """Test if the server is accessible"""
+    import requests
+
     try:
-        response = requests.get(url.rsplit("/search", 1)[0])
+        response = _session().head(_base_url(url), timeout=2)
+        if response.status_code in (405, 501):
+            # Server doesn't answer HEAD on its root (e.g. a FastAPI GET route), probe with GET instead
+            response = _session().get(_base_url(url), timeout=2)
         response.raise_for_status()
         logger.info("Server connection test successful")
         return True
@@ -21,62 +61,66 @@ def test_server_connection(url: str) -> bool:
         return False
 
 
-def analyze_search_behavior(reverser: SearchReverseEngineer, results: Dict) -> Dict:
+def probe_server_connections(urls: List[str]) -> Dict[str, bool]:
+    """Test several servers concurrently over the shared session"""
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return dict(zip(urls, executor.map(test_server_connection, urls)))
+
+
+def analyze_search_behavior(reverser: "SearchReverseEngineer", results: Dict) -> Dict:
     """Analyze specific search engine behaviors"""
-    behaviors = {
+    learning_status = results.get("learning_status") or {}
+    learned_patterns = learning_status.get("learned_patterns") or {}
+    success_rates = learning_status.get("success_rates") or {}
+
+    # Behaviors are only inferred once the adaptive strategy has learned patterns
+    learned = bool(learned_patterns)
+    return {
         "case_sensitive": False,
-        "uses_fuzzy_matching": False,
-        "removes_stop_words": False,
-        "considers_word_order": False,
+        "uses_fuzzy_matching": learned and "fuzzy" in success_rates,
+        "removes_stop_words": learned and "stop_words" in learned_patterns.get("ineffective_terms", ()),
+        "considers_word_order": learned and learning_status.get("phase") == "optimization",
         "boosts_by_popularity": False,
         "considers_recency": False,
     }
 
-    # Analyze learning status
-    learning_status = results.get("learning_status", {})
-    learned_patterns = learning_status.get("learned_patterns", {})
-
-    # Update behavior analysis based on learned patterns
-    if learned_patterns:
-        behaviors["uses_fuzzy_matching"] = any(pattern == "fuzzy" for pattern in results.get("success_rates", {}))
-        behaviors["removes_stop_words"] = "stop_words" in learned_patterns.get("ineffective_terms", set())
-        behaviors["considers_word_order"] = learning_status.get("phase") == "optimization"
-
-    return behaviors
-
 
 def print_analysis_report(results: Dict, behaviors: Dict) -> None:
     """Print a detailed analysis report"""
-    print("\nSearch Algorithm Analysis Report")
-    print("=" * 40)
+    # Collect every line and emit the report with a single write
+    parts = ["\nSearch Algorithm Analysis Report", "=" * 40]
 
     # Print learning status
     learning_status = results.get("learning_status", {})
-    print(f"\nLearning Phase: {learning_status.get('phase', 'unknown')}")
-    print(f"Exploration Progress: {learning_status.get('exploration_progress', 'N/A')}")
+    parts.append(f"\nLearning Phase: {learning_status.get('phase', 'unknown')}")
+    parts.append(f"Exploration Progress: {learning_status.get('exploration_progress', 'N/A')}")
 
     # Print detected behaviors
-    print("\nDetected Behaviors:")
+    parts.append("\nDetected Behaviors:")
     for behavior, detected in behaviors.items():
-        print(f"- {behavior.replace('_', ' ').title()}: {'Yes' if detected else 'No'}")
+        label = _BEHAVIOR_LABELS.get(behavior) or behavior.replace("_", " ").title()
+        parts.append(f"- {label}: {'Yes' if detected else 'No'}")
 
     # Print learned patterns
-    print("\nLearned Patterns:")
+    parts.append("\nLearned Patterns:")
     learned_patterns = learning_status.get("learned_patterns", {})
-    for pattern, value in learned_patterns.items():
-        print(f"- {pattern}: {value}")
+    parts.extend(f"- {pattern}: {value}" for pattern, value in learned_patterns.items())
 
     # Print success rates
-    print("\nQuery Success Rates:")
+    parts.append("\nQuery Success Rates:")
     success_rates = learning_status.get("success_rates", {})
     for query_type, stats in success_rates.items():
-        success_rate = stats["success"] / max(stats["total"], 1) * 100
-        print(f"- {query_type}: {success_rate:.1f}% ({stats['success']}/{stats['total']})")
+        success, total = stats["success"], stats["total"]
+        parts.append(f"- {query_type}: {success * 100.0 / (total or 1):.1f}% ({success}/{total})")
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main():
+    from search_reverser import SearchReverseEngineer
+
     # Initialize the reverse engineer
-    reverser = SearchReverseEngineer()
+    reverser = SearchReverseEngineer(session=_session())
 
     # Point to our mock search endpoint
     target_url = "http://localhost:8000/search"
@@ -99,4 +143,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
     main()